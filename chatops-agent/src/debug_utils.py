@@ -6,12 +6,49 @@ and other debugging helpers.
 """
 
 import json
+import sys
+import time
 from typing import Any, Dict
 from datetime import datetime
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Banner rules used by the dump/print helpers
+_EQ60 = "=" * 60
+_EQ80 = "=" * 80
+_DASH60 = "-" * 60
+
+# Keys format_log_output renders on the header line
+_LOG_HEADER_KEYS = frozenset(("timestamp", "level", "event"))
+
+# Pre-sized webhook payload shape cloned by create_test_payload
+_PAYLOAD_TEMPLATE = {"from": "", "body": "", "timestamp": 0}
+
+# Shared pretty-printing encoder (avoids rebuilding an encoder per dump)
+_PRETTY = json.JSONEncoder(indent=2, ensure_ascii=False, default=str).encode
+
+
+def _pretty_json(data: Any) -> str:
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits - let the stdlib encoder handle it
+            pass
+    return _PRETTY(data)
+
 
 def dump_payload(payload: Dict[str, Any], title: str = "Payload", redact: bool = True) -> str:
     """
@@ -25,10 +62,9 @@ def dump_payload(payload: Dict[str, Any], title: str = "Payload", redact: bool =
     Returns:
         Pretty-printed string representation
     """
-    import copy
-    
     if redact:
-        payload = copy.deepcopy(payload)
+        # Only top-level keys are redacted, so a shallow copy is sufficient
+        payload = {**payload}
         # Redact phone numbers
         if "from" in payload and isinstance(payload["from"], str):
             phone = payload["from"]
@@ -40,8 +76,8 @@ def dump_payload(payload: Dict[str, Any], title: str = "Payload", redact: bool =
                 payload["workflow_id"] = "***" + wid[-4:]
     
     try:
-        json_str = json.dumps(payload, indent=2, ensure_ascii=False, default=str)
-        return f"\n{'=' * 60}\n{title}\n{'=' * 60}\n{json_str}\n{'=' * 60}\n"
+        json_str = _pretty_json(payload)
+        return "\n".join(("", _EQ60, title, _EQ60, json_str, _EQ60, ""))
     except Exception as e:
         return f"Error dumping payload: {e}"
 
@@ -109,30 +145,33 @@ def inspect_message(message: str) -> Dict[str, Any]:
     Returns:
         Dictionary of diagnostic information
     """
+    n = len(message)
+    delimiter_count = message.count("|")
+    
     info = {
-        "length": len(message),
-        "has_delimiter": "|" in message,
-        "delimiter_count": message.count("|"),
+        "length": n,
+        "has_delimiter": delimiter_count > 0,
+        "delimiter_count": delimiter_count,
         "has_newlines": "\n" in message,
         "has_tabs": "\t" in message,
-        "starts_with_space": message.startswith(" ") if message else False,
-        "ends_with_space": message.endswith(" ") if message else False,
-        "is_empty": len(message) == 0,
+        "starts_with_space": message[:1] == " ",
+        "ends_with_space": message[-1:] == " ",
+        "is_empty": n == 0,
         "is_whitespace_only": message.isspace() if message else True,
-        "preview": message[:100] if len(message) > 100 else message
+        "preview": message[:100]
     }
     
-    # If message has delimiter, inspect parts
-    if info["has_delimiter"]:
-        parts = message.split("|", 1)
-        info["narrative_length"] = len(parts[0])
-        info["maxim_length"] = len(parts[1]) if len(parts) > 1 else 0
-        info["narrative_preview"] = parts[0][:50]
-        info["maxim_preview"] = parts[1][:50] if len(parts) > 1 else ""
+    # If message has delimiter, inspect parts without materializing a split
+    if delimiter_count:
+        idx = message.find("|")
+        info["narrative_length"] = idx
+        info["maxim_length"] = n - idx - 1
+        info["narrative_preview"] = message[:min(idx, 50)]
+        info["maxim_preview"] = message[idx + 1:idx + 51]
         
         # Check for empty parts after stripping
-        info["narrative_empty_after_strip"] = len(parts[0].strip()) == 0
-        info["maxim_empty_after_strip"] = len(parts[1].strip()) == 0 if len(parts) > 1 else True
+        info["narrative_empty_after_strip"] = idx == 0 or message[:idx].isspace()
+        info["maxim_empty_after_strip"] = idx == n - 1 or message[idx + 1:].isspace()
     
     return info
 
@@ -147,7 +186,8 @@ def format_log_output(log_dict: Dict[str, Any]) -> str:
     Returns:
         Formatted log string
     """
-    timestamp = log_dict.get("timestamp", datetime.now().isoformat())
+    # Only build a fallback timestamp when the record doesn't carry one
+    timestamp = log_dict["timestamp"] if "timestamp" in log_dict else datetime.now().isoformat()
     level = log_dict.get("level", "INFO")
     event = log_dict.get("event", "unknown")
     
@@ -155,9 +195,9 @@ def format_log_output(log_dict: Dict[str, Any]) -> str:
         f"[{timestamp}] [{level:8s}] {event}"
     ]
     
-    # Add other fields
-    for key, value in sorted(log_dict.items()):
-        if key not in ["timestamp", "level", "event"]:
+    # Add other fields in the order the log pipeline produced them
+    for key, value in log_dict.items():
+        if key not in _LOG_HEADER_KEYS:
             lines.append(f"  {key}: {value}")
     
     return "\n".join(lines)
@@ -175,12 +215,12 @@ def create_test_payload(from_number: str, message: str, **kwargs) -> Dict[str, A
     Returns:
         Webhook payload dictionary
     """
-    payload = {
-        "from": from_number,
-        "body": message,
-        "timestamp": int(datetime.now().timestamp())
-    }
-    payload.update(kwargs)
+    payload = _PAYLOAD_TEMPLATE.copy()
+    payload["from"] = from_number
+    payload["body"] = message
+    payload["timestamp"] = int(time.time())
+    if kwargs:
+        payload.update(kwargs)
     return payload
 
 
@@ -239,7 +279,7 @@ def analyze_error(error: Exception) -> Dict[str, Any]:
         analysis["http_status"] = getattr(response, "status_code", None)
         analysis["http_reason"] = getattr(response, "reason", None)
         analysis["http_url"] = getattr(response, "url", None)
-        analysis["http_body"] = getattr(response, "text", None)[:500]
+        analysis["http_body"] = (getattr(response, "text", None) or "")[:500]
     
     if hasattr(error, "args"):
         analysis["error_args"] = str(error.args)
@@ -254,9 +294,7 @@ def print_debug_header(title: str) -> None:
     Args:
         title: Section title
     """
-    print(f"\n{'=' * 80}")
-    print(f"  {title}")
-    print(f"{'=' * 80}\n")
+    sys.stdout.write(f"\n{_EQ80}\n  {title}\n{_EQ80}\n\n")
 
 
 def print_debug_section(title: str, content: Any) -> None:
@@ -267,14 +305,9 @@ def print_debug_section(title: str, content: Any) -> None:
         title: Section title
         content: Content to print
     """
-    print(f"\n{'-' * 60}")
-    print(f"{title}:")
-    print(f"{'-' * 60}")
-    if isinstance(content, dict):
-        print(json.dumps(content, indent=2, ensure_ascii=False, default=str))
-    else:
-        print(content)
-    print()
+    body = _pretty_json(content) if isinstance(content, dict) else str(content)
+    # Emit the whole section with a single write
+    sys.stdout.write(f"\n{_DASH60}\n{title}:\n{_DASH60}\n{body}\n\n")
 
 
 # Helper functions for interactive debugging
@@ -5,15 +5,47 @@ This module provides utilities for request inspection, payload validation,
 timing measurements, and other diagnostic capabilities.
 """
 
-import time
+from time import perf_counter
 import json
+import logging
+import inspect
 import functools
-from typing import Any, Callable, Dict, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Underlying stdlib logger, used for cheap level checks before building log calls
+_stdlib_logger = logging.getLogger(__name__)
+
+_ORJSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+
+def _dumps(data: Any) -> str:
+    """
+    Serialize data to indented JSON for debug dumps.
+    
+    Uses orjson when installed, otherwise (or for values orjson rejects)
+    the stdlib json module.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_DUMP_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, default=str)
+
 
 def dump_request(request_data: Dict[str, Any], redact_sensitive: bool = True) -> str:
     """
@@ -35,7 +67,7 @@ def dump_request(request_data: Dict[str, Any], redact_sensitive: bool = True) ->
             if len(phone) > 4:
                 data["from"] = "***" + phone[-4:]
     
-    return json.dumps(data, indent=2, default=str)
+    return _dumps(data)
 
 
 def dump_response(response_data: Dict[str, Any]) -> str:
@@ -48,35 +80,42 @@ def dump_response(response_data: Dict[str, Any]) -> str:
     Returns:
         Pretty-printed JSON string
     """
-    return json.dumps(response_data, indent=2, default=str)
+    return _dumps(response_data)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_required_fields(required_fields: tuple) -> tuple:
+    """
+    Pre-split required field names into lookup paths.
+    
+    Args:
+        required_fields: Tuple of field names, dotted for nested fields
+        
+    Returns:
+        Tuple of (field_name, path) pairs; path is None for top-level fields
+    """
+    return tuple(
+        (field, tuple(field.split("."))) if "." in field else (field, None)
+        for field in required_fields
+    )
 
 
-def validate_payload_structure(payload: Dict[str, Any], required_fields: list) -> tuple[bool, Optional[str]]:
+def validate_payload_structure(
+    payload: Dict[str, Any],
+    required_fields: Iterable[str]
+) -> tuple[bool, Optional[str]]:
     """
     Validate that payload contains required fields.
     
     Args:
         payload: Payload dictionary to validate
-        required_fields: List of required field names
+        required_fields: Required field names (dotted names check nested fields,
+            e.g. "source_data.narrative")
         
     Returns:
         Tuple of (is_valid, error_message)
     """
-    missing_fields = []
-    
-    for field in required_fields:
-        if "." in field:
-            # Support nested field checking (e.g., "source_data.narrative")
-            parts = field.split(".")
-            current = payload
-            for part in parts:
-                if not isinstance(current, dict) or part not in current:
-                    missing_fields.append(field)
-                    break
-                current = current[part]
-        else:
-            if field not in payload:
-                missing_fields.append(field)
+    missing_fields = _find_missing_fields(payload, _compile_required_fields(tuple(required_fields)))
     
     if missing_fields:
         return False, f"Missing required fields: {', '.join(missing_fields)}"
@@ -84,6 +123,88 @@ def validate_payload_structure(payload: Dict[str, Any], required_fields: list) -
     return True, None
 
 
+def _find_missing_fields(payload: Dict[str, Any], spec: tuple) -> list:
+    """
+    Return the required fields absent from a payload.
+    
+    Args:
+        payload: Payload dictionary to check
+        spec: Compiled (field_name, path) pairs from _compile_required_fields
+        
+    Returns:
+        List of missing field names, in spec order
+    """
+    missing_fields = []
+    add_missing = missing_fields.append
+    
+    for field, path in spec:
+        if path is None:
+            if field not in payload:
+                add_missing(field)
+            continue
+        
+        current = payload
+        try:
+            for part in path:
+                current = current[part]
+        except (KeyError, TypeError, IndexError):
+            add_missing(field)
+    
+    return missing_fields
+
+
+class SchemaValidator:
+    """
+    Required-field validator compiled once and reused across payloads.
+    
+    Useful when many payloads are checked against the same field list
+    (e.g. draining a queue of webhooks).
+    """
+    
+    __slots__ = ("_spec",)
+    
+    def __init__(self, required_fields: Iterable[str]):
+        """
+        Initialize the validator.
+        
+        Args:
+            required_fields: Required field names (dotted names check nested fields)
+        """
+        self._spec = _compile_required_fields(tuple(required_fields))
+    
+    def validate(self, payload: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+        """
+        Validate a single payload.
+        
+        Args:
+            payload: Payload dictionary to validate
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        missing_fields = _find_missing_fields(payload, self._spec)
+        if missing_fields:
+            return False, f"Missing required fields: {', '.join(missing_fields)}"
+        return True, None
+    
+    def validate_many(self, payloads: Iterable[Dict[str, Any]]) -> list:
+        """
+        Validate a batch of payloads in one pass.
+        
+        Args:
+            payloads: Payload dictionaries to validate
+            
+        Returns:
+            List of (is_valid, missing_fields) tuples, one per payload
+        """
+        spec = self._spec
+        results = []
+        for payload in payloads:
+            missing_fields = _find_missing_fields(payload, spec)
+            results.append((not missing_fields, missing_fields))
+        return results
+
+
 def timing_decorator(operation_name: str):
     """
     Decorator to measure and log execution time of functions.
@@ -95,45 +216,51 @@ def timing_decorator(operation_name: str):
         Decorated function
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
-                result = await func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
-                logger.info(
-                    "operation_completed",
-                    operation=operation_name,
-                    duration_ms=round(duration_ms, 2),
-                    status="success"
-                )
-                return result
-            except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
-                logger.error(
-                    "operation_failed",
-                    operation=operation_name,
-                    duration_ms=round(duration_ms, 2),
-                    status="error",
-                    error=str(e)
-                )
-                raise
+        # Decide sync vs async once, at decoration time, and build only that wrapper
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                    if _stdlib_logger.isEnabledFor(logging.INFO):
+                        duration_ms = (perf_counter() - start_time) * 1000
+                        logger.info(
+                            "operation_completed",
+                            operation=operation_name,
+                            duration_ms=round(duration_ms, 2),
+                            status="success"
+                        )
+                    return result
+                except Exception as e:
+                    duration_ms = (perf_counter() - start_time) * 1000
+                    logger.error(
+                        "operation_failed",
+                        operation=operation_name,
+                        duration_ms=round(duration_ms, 2),
+                        status="error",
+                        error=str(e)
+                    )
+                    raise
+            
+            return async_wrapper
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
-                logger.info(
-                    "operation_completed",
-                    operation=operation_name,
-                    duration_ms=round(duration_ms, 2),
-                    status="success"
-                )
+                if _stdlib_logger.isEnabledFor(logging.INFO):
+                    duration_ms = (perf_counter() - start_time) * 1000
+                    logger.info(
+                        "operation_completed",
+                        operation=operation_name,
+                        duration_ms=round(duration_ms, 2),
+                        status="success"
+                    )
                 return result
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (perf_counter() - start_time) * 1000
                 logger.error(
                     "operation_failed",
                     operation=operation_name,
@@ -143,11 +270,7 @@ def timing_decorator(operation_name: str):
                 )
                 raise
         
-        # Return appropriate wrapper based on function type
-        if functools.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
@@ -168,22 +291,24 @@ class RequestTimer:
     
     def __enter__(self):
         """Start timing."""
-        self.start_time = time.time()
-        logger.debug("segment_started", segment=self.segment_name)
+        self.start_time = perf_counter()
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("segment_started", segment=self.segment_name)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End timing and log duration."""
-        self.end_time = time.time()
+        self.end_time = perf_counter()
         duration_ms = (self.end_time - self.start_time) * 1000
         
         if exc_type is None:
-            logger.info(
-                "segment_completed",
-                segment=self.segment_name,
-                duration_ms=round(duration_ms, 2),
-                status="success"
-            )
+            if _stdlib_logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "segment_completed",
+                    segment=self.segment_name,
+                    duration_ms=round(duration_ms, 2),
+                    status="success"
+                )
         else:
             logger.error(
                 "segment_failed",
@@ -196,24 +321,34 @@ class RequestTimer:
     @property
     def duration_ms(self) -> Optional[float]:
         """Get duration in milliseconds."""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return (self.end_time - self.start_time) * 1000
         return None
 
 
+# Error categories tracked individually; anything else is counted as "unknown"
+_ERROR_CATEGORIES = ("validation", "parsing", "integration", "unknown")
+_KNOWN_ERROR_CATEGORIES = frozenset(_ERROR_CATEGORIES)
+
+# Seconds of per-second error buckets kept for count_since (one hour)
+_BUCKET_RETENTION_SECONDS = 3600
+
+
 class ErrorTracker:
     """Track errors by category for metrics."""
     
     def __init__(self):
         """Initialize error tracker."""
-        self.errors = {
-            "validation": 0,
-            "parsing": 0,
-            "integration": 0,
-            "unknown": 0
-        }
-        self.recent_errors = []  # T044: Store recent error details
+        # Each thread counts into its own Counter so concurrent track_error
+        # calls never race on a shared dict; readers merge the shards.
+        self._local = threading.local()
+        self._shards: list = []
+        # Per-thread deques of (epoch second, Counter by category) buckets
+        self._bucket_shards: list = []
+        self._shards_lock = threading.Lock()
         self.max_recent_errors = 100
+        # T044: Store recent error details (oldest entries drop off automatically)
+        self.recent_errors: deque = deque(maxlen=self.max_recent_errors)
         self.last_reset = datetime.now()
     
     def track_error(self, error_category: str, details: Optional[Dict[str, Any]] = None) -> None:
@@ -224,10 +359,16 @@ class ErrorTracker:
             error_category: Category of error (validation, parsing, integration, unknown)
             details: Optional dictionary with error details for debugging
         """
-        if error_category in self.errors:
-            self.errors[error_category] += 1
-        else:
-            self.errors["unknown"] += 1
+        counted_category = error_category if error_category in _KNOWN_ERROR_CATEGORIES else "unknown"
+        counts = self._local_counts()
+        counts[counted_category] += 1
+        
+        # Bump this second's bucket for windowed counts (count_since)
+        second = int(time.time())
+        buckets = self._local_buckets()
+        if not buckets or buckets[-1][0] != second:
+            buckets.append((second, Counter()))
+        buckets[-1][1][error_category] += 1
         
         # T044: Store recent error with details
         error_entry = {
@@ -237,15 +378,11 @@ class ErrorTracker:
         }
         self.recent_errors.append(error_entry)
         
-        # Keep only recent errors
-        if len(self.recent_errors) > self.max_recent_errors:
-            self.recent_errors = self.recent_errors[-self.max_recent_errors:]
-        
         # T045: Log error with context
         logger.warning(
             "error_tracked",
             category=error_category,
-            total_in_category=self.errors.get(error_category, self.errors["unknown"]),
+            total_in_category=counts[counted_category],
             details=details
         )
     
@@ -256,12 +393,22 @@ class ErrorTracker:
         Returns:
             Dictionary of error counts by category
         """
-        return self.errors.copy()
+        return self._merged_counts()
+    
+    @property
+    def errors(self) -> Dict[str, int]:
+        """Error counts by category, merged across all threads."""
+        return self._merged_counts()
     
     def reset(self) -> None:
         """Reset error counts and clear recent errors."""
-        self.errors = {key: 0 for key in self.errors}
-        self.recent_errors = []
+        with self._shards_lock:
+            for shard in self._shards:
+                for category in shard:
+                    shard[category] = 0
+            for buckets in self._bucket_shards:
+                buckets.clear()
+        self.recent_errors.clear()
         self.last_reset = datetime.now()
     
     def get_summary(self) -> Dict[str, Any]:
@@ -272,11 +419,12 @@ class ErrorTracker:
             Dictionary with error summary
         """
         time_since_reset = (datetime.now() - self.last_reset).total_seconds()
+        errors = self._merged_counts()
         return {
-            "errors": self.errors.copy(),
-            "total_errors": sum(self.errors.values()),
+            "errors": errors,
+            "total_errors": sum(errors.values()),
             "recent_errors_count": len(self.recent_errors),
-            "recent_errors": self.recent_errors[-10:],  # Last 10 errors
+            "recent_errors": self._tail(10),  # Last 10 errors
             "time_since_reset_seconds": round(time_since_reset, 2),
             "last_reset": self.last_reset.isoformat()
         }
@@ -291,7 +439,70 @@ class ErrorTracker:
         Returns:
             List of recent error entries
         """
-        return self.recent_errors[-limit:] if limit else self.recent_errors
+        return self._tail(limit)
+    
+    def count_since(self, cutoff: float) -> Dict[str, int]:
+        """
+        Count errors by category recorded after a point in time.
+        
+        Uses the per-second buckets, so the cost depends on the window
+        length rather than the number of errors. Resolution is one second:
+        the bucket containing the cutoff is included.
+        
+        Args:
+            cutoff: POSIX time marking the start of the window
+            
+        Returns:
+            Dictionary of error counts by category within the window
+        """
+        cutoff_second = int(cutoff)
+        totals: Counter = Counter()
+        with self._shards_lock:
+            bucket_shards = list(self._bucket_shards)
+        for buckets in bucket_shards:
+            # Snapshot (atomic copy) since the owning thread may be appending
+            for second, counts in reversed(list(buckets)):
+                if second < cutoff_second:
+                    break
+                totals.update(dict(counts))
+        return dict(totals)
+    
+    def _local_counts(self) -> Counter:
+        """Return the calling thread's counter shard, registering it on first use."""
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            # Pre-seed every category so merging never sees the shard resize
+            counts = Counter(dict.fromkeys(_ERROR_CATEGORIES, 0))
+            self._local.counts = counts
+            with self._shards_lock:
+                self._shards.append(counts)
+        return counts
+    
+    def _local_buckets(self) -> deque:
+        """Return the calling thread's per-second buckets, registering them on first use."""
+        buckets = getattr(self._local, "buckets", None)
+        if buckets is None:
+            buckets = deque(maxlen=_BUCKET_RETENTION_SECONDS)
+            self._local.buckets = buckets
+            with self._shards_lock:
+                self._bucket_shards.append(buckets)
+        return buckets
+    
+    def _merged_counts(self) -> Dict[str, int]:
+        """Sum the per-thread shards into a single category -> count mapping."""
+        merged = dict.fromkeys(_ERROR_CATEGORIES, 0)
+        with self._shards_lock:
+            for shard in self._shards:
+                for category, count in shard.items():
+                    merged[category] += count
+        return merged
+    
+    def _tail(self, count: int) -> list:
+        """Return the newest ``count`` recent errors (all when falsy), oldest first."""
+        if not count:
+            return list(self.recent_errors)
+        start = max(0, len(self.recent_errors) - count)
+        return list(islice(self.recent_errors, start, None))
 
 
 # Global error tracker instance
@@ -321,7 +532,8 @@ def log_slow_operation(operation: str, duration_ms: float, threshold_ms: float =
         duration_ms: Operation duration in milliseconds
         threshold_ms: Threshold for slow operation (default 2000ms)
     """
-    if check_slow_operation(duration_ms, threshold_ms):
+    # Inlined threshold check so the common fast case costs a single comparison
+    if duration_ms > threshold_ms:
         logger.warning(
             "slow_operation_detected",
             operation=operation,
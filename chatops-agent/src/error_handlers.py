@@ -5,12 +5,55 @@ This module defines specific exception types for different error scenarios,
 enabling better error categorization, handling, and diagnostics.
 """
 
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, Dict, Optional, Union
+
+
+def _pack_details(**fields: Any) -> Dict[str, Any]:
+    """
+    Build an exception details dict, dropping fields that were not provided.
+    
+    Args:
+        **fields: Candidate detail fields (None means absent)
+        
+    Returns:
+        Dictionary containing only the fields with values
+    """
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _truncate(value: Any, limit: int) -> str:
+    """
+    Shorten a value to at most ``limit`` characters for error details.
+    
+    Strings and bytes are sliced before any conversion so a large payload
+    is never copied in full just to be cut down.
+    
+    Args:
+        value: Value to truncate (str, bytes or any object)
+        limit: Maximum length of the result
+        
+    Returns:
+        Truncated string representation
+    """
+    if isinstance(value, str):
+        return value[:limit]
+    if isinstance(value, (bytes, bytearray)):
+        return value[:limit].decode("utf-8", "replace")
+    return str(value)[:limit]
 
 
 class ChatOpsAgentError(Exception):
     """Base exception class for all ChatOps Agent errors."""
     
+    # Class name reported as error_type, cached per class
+    _type_name = "ChatOpsAgentError"
+    
+    def __init_subclass__(cls, **kwargs):
+        """Cache the reported error type name on each subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         """
         Initialize base exception.
@@ -31,7 +74,7 @@ class ChatOpsAgentError(Exception):
             Dictionary representation of the error
         """
         return {
-            "error_type": self.__class__.__name__,
+            "error_type": self._type_name,
             "message": self.message,
             "details": self.details
         }
@@ -56,13 +99,10 @@ class WebhookValidationError(ChatOpsAgentError):
             field_name: Name of the field that failed validation
             received_value: The value that failed validation
         """
-        details = {}
-        if field_name:
-            details["field"] = field_name
-        if received_value is not None:
-            details["received_value"] = str(received_value)[:100]  # Limit length
-        
-        super().__init__(message, details)
+        super().__init__(message, _pack_details(
+            field=field_name or None,
+            received_value=_truncate(received_value, 100) if received_value is not None else None  # Limit length
+        ))
         self.field_name = field_name
         self.received_value = received_value
 
@@ -86,13 +126,10 @@ class ParseError(ChatOpsAgentError):
             raw_message: The raw message that failed to parse
             parse_stage: Stage where parsing failed (e.g., 'delimiter_check', 'extraction')
         """
-        details = {}
-        if raw_message:
-            details["raw_message"] = raw_message[:200]  # Limit length for logging
-        if parse_stage:
-            details["parse_stage"] = parse_stage
-        
-        super().__init__(message, details)
+        super().__init__(message, _pack_details(
+            raw_message=_truncate(raw_message, 200) if raw_message else None,  # Limit length for logging
+            parse_stage=parse_stage or None
+        ))
         self.raw_message = raw_message
         self.parse_stage = parse_stage
 
@@ -112,7 +149,7 @@ class UnionAPIError(ChatOpsAgentError):
         self,
         message: str,
         status_code: Optional[int] = None,
-        response_body: Optional[str] = None,
+        response_body: Optional[Union[str, bytes]] = None,
         endpoint: Optional[str] = None
     ):
         """
@@ -124,15 +161,11 @@ class UnionAPIError(ChatOpsAgentError):
             response_body: Response body from API (for debugging)
             endpoint: API endpoint that was called
         """
-        details = {}
-        if status_code:
-            details["status_code"] = status_code
-        if response_body:
-            details["response_body"] = response_body[:500]  # Limit length
-        if endpoint:
-            details["endpoint"] = endpoint
-        
-        super().__init__(message, details)
+        super().__init__(message, _pack_details(
+            status_code=status_code or None,
+            response_body=_truncate(response_body, 500) if response_body else None,  # Limit length
+            endpoint=endpoint or None
+        ))
         self.status_code = status_code
         self.response_body = response_body
         self.endpoint = endpoint
@@ -163,13 +196,10 @@ class NetworkError(ChatOpsAgentError):
             target_url: URL that was being accessed
             network_error_type: Type of network error (e.g., 'timeout', 'connection_refused')
         """
-        details = {}
-        if target_url:
-            details["target_url"] = target_url
-        if network_error_type:
-            details["network_error_type"] = network_error_type
-        
-        super().__init__(message, details)
+        super().__init__(message, _pack_details(
+            target_url=target_url or None,
+            network_error_type=network_error_type or None
+        ))
         self.target_url = target_url
         self.network_error_type = network_error_type
 
@@ -192,11 +222,7 @@ class ConfigurationError(ChatOpsAgentError):
             message: Error message
             config_key: Configuration key that caused the error
         """
-        details = {}
-        if config_key:
-            details["config_key"] = config_key
-        
-        super().__init__(message, details)
+        super().__init__(message, _pack_details(config_key=config_key or None))
         self.config_key = config_key
 
 
@@ -226,20 +252,36 @@ class ValidationError(ChatOpsAgentError):
             expected: Expected value or format
             actual: Actual value that failed validation
         """
-        details = {}
-        if validation_rule:
-            details["validation_rule"] = validation_rule
-        if expected is not None:
-            details["expected"] = str(expected)
-        if actual is not None:
-            details["actual"] = str(actual)[:100]  # Limit length
-        
-        super().__init__(message, details)
+        super().__init__(message, _pack_details(
+            validation_rule=validation_rule or None,
+            expected=str(expected) if expected is not None else None,
+            actual=_truncate(actual, 100) if actual is not None else None  # Limit length
+        ))
         self.validation_rule = validation_rule
         self.expected = expected
         self.actual = actual
 
 
+# Error category for each exception class; subclasses resolve via their MRO
+_ERROR_CATEGORY_BY_TYPE: Dict[type, str] = {
+    WebhookValidationError: "validation",
+    ValidationError: "validation",
+    ParseError: "parsing",
+    UnionAPIError: "integration",
+    NetworkError: "integration",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _category_for_type(exception_type: type) -> str:
+    """Resolve (and memoize) the error category for an exception class."""
+    for base in exception_type.__mro__:
+        category = _ERROR_CATEGORY_BY_TYPE.get(base)
+        if category is not None:
+            return category
+    return "unknown"
+
+
 def categorize_error(exception: Exception) -> str:
     """
     Categorize an exception for metrics and logging.
@@ -250,14 +292,7 @@ def categorize_error(exception: Exception) -> str:
     Returns:
         Error category string ('validation', 'parsing', 'integration', 'unknown')
     """
-    if isinstance(exception, (WebhookValidationError, ValidationError)):
-        return "validation"
-    elif isinstance(exception, ParseError):
-        return "parsing"
-    elif isinstance(exception, (UnionAPIError, NetworkError)):
-        return "integration"
-    else:
-        return "unknown"
+    return _category_for_type(type(exception))
 
 
 def extract_error_context(exception: Exception) -> Dict[str, Any]:
@@ -5,14 +5,86 @@ This module provides consistent error response formatting with correlation IDs,
 timestamps, and contextual information for debugging.
 """
 
+import os
+import time
+from contextvars import ContextVar
 from typing import Any, Dict, Optional
-from datetime import datetime
 import structlog
 
 from .logging_config import get_correlation_id
 
 logger = structlog.get_logger(__name__)
 
+# Per-request slot for the response timestamp shared by every builder within
+# one request. The middleware opens an empty slot; get_response_timestamp
+# fills it on first use, so requests that build no response skip formatting.
+request_timestamp_var: ContextVar[Optional[list]] = ContextVar('request_timestamp', default=None)
+
+# Whether error details are exposed to clients. Resolved on first use rather
+# than at import, so ENVIRONMENT values loaded from .env are honoured.
+_IS_DEV: Optional[bool] = None
+
+
+def _is_dev() -> bool:
+    """Return whether ENVIRONMENT is 'dev', reading it once on first use."""
+    global _IS_DEV
+    if _IS_DEV is None:
+        _IS_DEV = os.getenv("ENVIRONMENT", "dev") == "dev"
+    return _IS_DEV
+
+
+def refresh_env() -> None:
+    """Re-read ENVIRONMENT on next use after it has been changed at runtime."""
+    global _IS_DEV
+    _IS_DEV = None
+
+
+def format_utc_timestamp(epoch_seconds: Optional[float] = None) -> str:
+    """
+    Format a POSIX time as an ISO-8601 UTC string with a trailing 'Z'.
+    
+    Args:
+        epoch_seconds: Seconds since the epoch (defaults to now)
+        
+    Returns:
+        Timestamp such as '2024-01-01T12:00:00.123456Z'
+    """
+    if epoch_seconds is None:
+        epoch_seconds = time.time()
+    t = time.gmtime(epoch_seconds)
+    micros = int((epoch_seconds % 1) * 1_000_000)
+    return "%04d-%02d-%02dT%02d:%02d:%02d.%06dZ" % (
+        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, micros
+    )
+
+
+def set_request_timestamp() -> None:
+    """Open an empty response timestamp slot for the current request."""
+    request_timestamp_var.set([None])
+
+
+def clear_request_timestamp() -> None:
+    """Clear the per-request response timestamp."""
+    request_timestamp_var.set(None)
+
+
+def get_response_timestamp() -> str:
+    """
+    Get the current request's response timestamp, or a fresh one outside a request.
+    
+    The time is read and formatted when the request first builds a response
+    (not when it arrived) and reused by later builders in the same request.
+    
+    Returns:
+        ISO-8601 UTC timestamp string
+    """
+    slot = request_timestamp_var.get()
+    if slot is None:
+        return format_utc_timestamp()
+    if slot[0] is None:
+        slot[0] = format_utc_timestamp()
+    return slot[0]
+
 
 def build_error_response(
     detail: str,
@@ -39,7 +111,7 @@ def build_error_response(
     response = {
         "status": "error",
         "detail": detail,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": get_response_timestamp()
     }
     
     if correlation_id:
@@ -196,6 +268,7 @@ def build_server_error_response(
     return build_error_response(
         detail=message,
         error_code="INTERNAL_ERROR",
+        correlation_id=correlation_id,
         additional_context=context if context else None
     )
 
@@ -211,11 +284,9 @@ def sanitize_error_for_client(error: Exception, include_details: bool = False) -
     Returns:
         Sanitized error message
     """
-    import os
-    
     # In development, optionally include more details
-    if include_details or os.getenv("ENVIRONMENT", "dev") == "dev":
-        return f"Error: {str(error)}"
+    if include_details or _is_dev():
+        return f"Error: {error}"
     
     # In production, return generic message
     return "An error occurred while processing your request"
@@ -266,7 +337,7 @@ def build_success_response(
     response = {
         "status": "received",
         "workflow_result": workflow_result,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": get_response_timestamp()
     }
     
     correlation_id = get_correlation_id()
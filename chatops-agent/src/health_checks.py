@@ -7,55 +7,102 @@ for comprehensive service health monitoring.
 
 import os
 import time
+import asyncio
+import heapq
+import inspect
 import psutil
 import structlog
 import httpx
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable
-from functools import wraps
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+from functools import lru_cache, wraps
+
+from .error_responses import format_utc_timestamp
 
 logger = structlog.get_logger(__name__)
 
 # Service start time for uptime calculation
 service_start_time = datetime.now()
+# Monotonic reference for uptime; unaffected by wall-clock adjustments
+_START_MONOTONIC = time.monotonic()
+
+# Shared client for dependency health checks; keep-alive connections are
+# reused across polls instead of a new handshake per check
+_health_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_health_client() -> httpx.AsyncClient:
+    """Return the shared health check client, creating it if missing or closed."""
+    global _health_client
+    if _health_client is None or _health_client.is_closed:
+        _health_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+        )
+    return _health_client
+
+
+# Caps outgoing check fan-out when many /health requests arrive at once;
+# built at startup (see init_health_check_semaphore)
+_health_check_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def init_health_check_semaphore() -> None:
+    """Size the health check concurrency cap from MAX_CONCURRENT_HEALTH_CHECKS."""
+    global _health_check_semaphore
+    _health_check_semaphore = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_HEALTH_CHECKS", "10")))
+
+
+async def _guarded(awaitable):
+    """Await a health check while holding a concurrency slot."""
+    if _health_check_semaphore is None:
+        init_health_check_semaphore()
+    async with _health_check_semaphore:
+        return await awaitable
+
+
+# Handle for this process, reused so each memory check doesn't reopen it
+_PROCESS = psutil.Process(os.getpid())
+
 
+@lru_cache(maxsize=1)
+def _virtual_memory_for_second(second: int):
+    """Return system memory stats, computed at most once per wall-clock second."""
+    return psutil.virtual_memory()
 
-def with_timeout(seconds: float):
+
+async def close_health_check_client() -> None:
+    """Close the shared health check HTTP client (call on shutdown)."""
+    if _health_client is not None:
+        await _health_client.aclose()
+
+
+def _timeout_result(seconds: float) -> Dict[str, Any]:
+    """Build the result reported when a health check exceeds its timeout."""
+    return {
+        "status": "timeout",
+        "error": f"Check exceeded {seconds}s timeout"
+    }
+
+
+def with_timeout_async(seconds: float):
     """
-    Decorator to add timeout to health check functions.
+    Decorator to add a timeout to async health check functions.
     
     Args:
-        seconds: Timeout in seconds
+        seconds: Timeout in seconds (sub-second values are honoured)
         
     Returns:
-        Decorated function that times out
+        Decorated coroutine function that times out
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError(f"Health check timed out after {seconds}s")
-            
-            # Set alarm (Unix only, for Windows we'd need threading)
+        async def wrapper(*args, **kwargs):
             try:
-                old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(int(seconds))
-                try:
-                    result = func(*args, **kwargs)
-                finally:
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
-                return result
-            except AttributeError:
-                # Windows doesn't have SIGALRM, just run without timeout
-                return func(*args, **kwargs)
-            except TimeoutError:
-                return {
-                    "status": "timeout",
-                    "error": f"Check exceeded {seconds}s timeout"
-                }
+                return await asyncio.wait_for(func(*args, **kwargs), seconds)
+            except asyncio.TimeoutError:
+                return _timeout_result(seconds)
         return wrapper
     return decorator
 
@@ -65,29 +112,42 @@ def safe_health_check(func: Callable) -> Callable:
     Decorator to wrap health checks with exception handling.
     
     Ensures health checks never crash the health endpoint.
+    Works with both sync and async check functions.
     """
+    def failure_result(e: Exception) -> Dict[str, Any]:
+        logger.error(
+            "health_check_failed",
+            check=func.__name__,
+            error=str(e),
+            exc_info=True
+        )
+        return {
+            "status": "error",
+            "error": str(e),
+            "check": func.__name__
+        }
+    
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return failure_result(e)
+        return async_wrapper
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(
-                "health_check_failed",
-                check=func.__name__,
-                error=str(e),
-                exc_info=True
-            )
-            return {
-                "status": "error",
-                "error": str(e),
-                "check": func.__name__
-            }
+            return failure_result(e)
     return wrapper
 
 
 @safe_health_check
-@with_timeout(5.0)
-def check_union_action_api() -> Dict[str, Any]:
+@with_timeout_async(5.0)
+async def check_union_action_api() -> Dict[str, Any]:
     """
     Check Union Action API health.
     
@@ -100,34 +160,34 @@ def check_union_action_api() -> Dict[str, Any]:
         health_url = f"{union_action_url}/health"
         
         # Make HTTP request to Union Action API health endpoint
-        with httpx.Client(timeout=5.0) as client:
-            response = client.get(health_url)
-            response.raise_for_status()
-            
-            health_data = response.json()
-            
-            # Extract status from Union Action API response
-            union_status = health_data.get("status", "unknown")
-            
-            result = {
-                "status": union_status,
-                "url": health_url,
-                "response_time_ms": response.elapsed.total_seconds() * 1000
-            }
-            
-            # Add additional info if available
-            if "version" in health_data:
-                result["version"] = health_data["version"]
-            if "uptime_seconds" in health_data:
-                result["uptime_seconds"] = health_data["uptime_seconds"]
-            
-            logger.debug(
-                "union_action_api_check_complete",
-                status=union_status,
-                response_time_ms=result["response_time_ms"]
-            )
-            
-            return result
+        # (httpx enforces the 5s timeout without blocking the event loop)
+        response = await _get_health_client().get(health_url)
+        response.raise_for_status()
+        
+        health_data = response.json()
+        
+        # Extract status from Union Action API response
+        union_status = health_data.get("status", "unknown")
+        
+        result = {
+            "status": union_status,
+            "url": health_url,
+            "response_time_ms": response.elapsed.total_seconds() * 1000
+        }
+        
+        # Add additional info if available
+        if "version" in health_data:
+            result["version"] = health_data["version"]
+        if "uptime_seconds" in health_data:
+            result["uptime_seconds"] = health_data["uptime_seconds"]
+        
+        logger.debug(
+            "union_action_api_check_complete",
+            status=union_status,
+            response_time_ms=result["response_time_ms"]
+        )
+        
+        return result
             
     except httpx.TimeoutException:
         logger.warning("union_action_api_timeout", url=health_url)
@@ -168,13 +228,12 @@ def check_memory_usage(threshold_percent: float = 80.0) -> Dict[str, Any]:
     """
     try:
         # Get process memory info
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        memory_info = _PROCESS.memory_info()
         memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
         
         # Get system memory if available
         try:
-            system_memory = psutil.virtual_memory()
+            system_memory = _virtual_memory_for_second(int(time.time()))
             memory_percent = system_memory.percent
         except:
             memory_percent = None
@@ -209,6 +268,21 @@ def check_memory_usage(threshold_percent: float = 80.0) -> Dict[str, Any]:
         }
 
 
+async def check_memory_usage_async(threshold_percent: float = 80.0) -> Dict[str, Any]:
+    """
+    Check current memory usage without blocking the event loop.
+    
+    The /proc reads behind psutil run in a worker thread.
+    
+    Args:
+        threshold_percent: Percentage threshold for warning
+        
+    Returns:
+        Dictionary with memory usage info and status
+    """
+    return await asyncio.to_thread(check_memory_usage, threshold_percent)
+
+
 def get_uptime() -> float:
     """
     Get service uptime in seconds.
@@ -216,8 +290,7 @@ def get_uptime() -> float:
     Returns:
         Uptime in seconds
     """
-    uptime = (datetime.now() - service_start_time).total_seconds()
-    return uptime
+    return time.monotonic() - _START_MONOTONIC
 
 
 def get_uptime_formatted() -> str:
@@ -227,11 +300,8 @@ def get_uptime_formatted() -> str:
     Returns:
         Formatted uptime string (e.g., "2h 30m 15s")
     """
-    uptime_seconds = get_uptime()
-    
-    hours = int(uptime_seconds // 3600)
-    minutes = int((uptime_seconds % 3600) // 60)
-    seconds = int(uptime_seconds % 60)
+    hours, remainder = divmod(int(get_uptime()), 3600)
+    minutes, seconds = divmod(remainder, 60)
     
     parts = []
     if hours > 0:
@@ -256,35 +326,54 @@ def check_recent_errors(time_window_seconds: int = 300) -> Dict[str, Any]:
     """
     from .diagnostics import error_tracker
     
-    # Get recent errors from tracker
-    recent_errors = error_tracker.get_recent_errors(limit=1000)  # Get many
-    
-    # Filter to time window
-    cutoff_time = datetime.now() - timedelta(seconds=time_window_seconds)
-    
-    errors_in_window = []
-    for error in recent_errors:
-        try:
-            error_time = datetime.fromisoformat(error["timestamp"])
-            if error_time > cutoff_time:
-                errors_in_window.append(error)
-        except:
-            # Skip errors with invalid timestamps
-            continue
-    
-    # Count by category
-    by_category = {}
-    for error in errors_in_window:
-        category = error.get("category", "unknown")
-        by_category[category] = by_category.get(category, 0) + 1
+    # Count errors by category within the time window from tracker
+    by_category = error_tracker.count_since(time.time() - time_window_seconds)
     
     return {
-        "count": len(errors_in_window),
+        "count": sum(by_category.values()),
         "time_window_seconds": time_window_seconds,
         "by_category": by_category
     }
 
 
+async def run_all_checks(
+    memory_threshold_percent: float = 80.0,
+    error_window_seconds: int = 300
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run all dependency and resource checks concurrently.
+    
+    Blocking checks run in worker threads so the total latency is that of
+    the slowest check rather than the sum of all of them. Concurrency across
+    all callers is capped by MAX_CONCURRENT_HEALTH_CHECKS (default 10).
+    
+    Args:
+        memory_threshold_percent: Percentage threshold for memory warning
+        error_window_seconds: Time window for the recent error count
+        
+    Returns:
+        Dictionary of check results keyed by check name; a check that raised
+        is reported as {"status": "error", ...}
+    """
+    checks = {
+        "union_action_api": check_union_action_api(),
+        "memory": check_memory_usage_async(memory_threshold_percent),
+        "recent_errors": asyncio.to_thread(check_recent_errors, error_window_seconds),
+    }
+    results = await asyncio.gather(
+        *(_guarded(check) for check in checks.values()),
+        return_exceptions=True
+    )
+    
+    combined = {}
+    for name, result in zip(checks, results):
+        if isinstance(result, BaseException):
+            logger.error("health_check_failed", check=name, error=str(result))
+            result = {"status": "error", "error": str(result), "check": name}
+        combined[name] = result
+    return combined
+
+
 def aggregate_health_status(checks: List[Dict[str, Any]]) -> str:
     """
     Aggregate multiple health check results into overall status.
@@ -295,14 +384,12 @@ def aggregate_health_status(checks: List[Dict[str, Any]]) -> str:
     Returns:
         Overall status: 'ok', 'degraded', or 'down'
     """
-    statuses = [check.get("status", "unknown") for check in checks]
-    
-    # Count status types
-    error_count = statuses.count("error")
-    timeout_count = statuses.count("timeout")
-    unknown_count = statuses.count("unknown")
+    # Count status types in a single pass
+    status_counts = Counter(check.get("status", "unknown") for check in checks)
+    error_count = status_counts["error"]
+    timeout_count = status_counts["timeout"]
     
-    total_checks = len(statuses)
+    total_checks = len(checks)
     
     if total_checks == 0:
         return "unknown"
@@ -323,18 +410,32 @@ def aggregate_health_status(checks: List[Dict[str, Any]]) -> str:
     return "unknown"
 
 
+# Successful results are cached longer than failures so recoveries show up quickly
+SUCCESS_TTL_SECONDS = 27
+FAILURE_TTL_SECONDS = 9
+_SUCCESS_STATUSES = frozenset({"ok", "healthy"})
+
+
 class HealthCheckCache:
-    """Simple cache for health check results to avoid overload."""
+    """Bounded LRU cache for health check results to avoid overload."""
     
-    def __init__(self, ttl_seconds: int = 10):
+    def __init__(self, ttl_seconds: int = 10, maxsize: int = 128):
         """
         Initialize cache.
         
         Args:
-            ttl_seconds: Time-to-live for cached results
+            ttl_seconds: Default time-to-live for cached results
+            maxsize: Maximum number of entries; least recently used are evicted
         """
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, tuple[Any, float]] = {}
+        self.maxsize = maxsize
+        # key -> (value, expires_at), least recently used first
+        self.cache: "OrderedDict[str, tuple[Any, float]]" = OrderedDict()
+        # Min-heap of (expires_at, key); may hold stale items for keys that
+        # were overwritten or evicted since they were pushed
+        self._expiry: List[tuple[float, str]] = []
+        # key -> task for a computation currently in progress
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -347,27 +448,127 @@ class HealthCheckCache:
             Cached value or None if expired/missing
         """
         if key in self.cache:
-            value, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl_seconds:
+            value, expires_at = self.cache[key]
+            if time.time() < expires_at:
+                self.cache.move_to_end(key)
                 return value
             else:
                 # Expired - remove
                 del self.cache[key]
         return None
     
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """
-        Set cached value with current timestamp.
+        Set cached value with an expiry time.
         
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Time-to-live in seconds (defaults to ttl_seconds)
         """
-        self.cache[key] = (value, time.time())
+        if ttl is None:
+            ttl = self.ttl_seconds
+        
+        # Drop whatever has already expired before making room
+        now = time.time()
+        self._prune_expired(now)
+        
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.maxsize:
+            # Evict least recently used entry
+            self.cache.popitem(last=False)
+        expires_at = now + ttl
+        self.cache[key] = (value, expires_at)
+        heapq.heappush(self._expiry, (expires_at, key))
+    
+    def prune(self) -> int:
+        """
+        Remove all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        return self._prune_expired(time.time())
+    
+    def _prune_expired(self, now: float) -> int:
+        """Pop expired heap items, deleting entries whose expiry still matches."""
+        removed = 0
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(expiry)
+            entry = self.cache.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self.cache[key]
+                removed += 1
+        return removed
+    
+    def set_result(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Cache a health check result with a TTL based on its status.
+        
+        Args:
+            key: Cache key
+            result: Health check result with a 'status' field
+        """
+        if result.get("status") in _SUCCESS_STATUSES:
+            ttl = SUCCESS_TTL_SECONDS
+        else:
+            ttl = FAILURE_TTL_SECONDS
+        self.set(key, result, ttl=ttl)
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        coro_factory: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for key, computing it at most once at a time.
+        
+        Concurrent callers that miss the cache while a computation for the
+        same key is running await that computation instead of starting their
+        own. The computation runs in its own task, so a cancelled caller
+        (e.g. a disconnected client) does not cancel it for the others. The
+        fresh result is cached via set_result.
+        
+        Args:
+            key: Cache key
+            coro_factory: Zero-argument callable returning the check coroutine
+            
+        Returns:
+            Cached or freshly computed health check result
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        
+        # No await between the lookup and the insert, so this is atomic
+        # on the event loop without an extra lock
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compute(key, coro_factory))
+            # Mark any exception retrieved even if every caller has gone away
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+    
+    async def _compute(
+        self,
+        key: str,
+        coro_factory: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Run one shared computation for get_or_compute and cache its result."""
+        try:
+            result = await coro_factory()
+            self.set_result(key, result)
+            return result
+        finally:
+            del self._inflight[key]
     
     def clear(self) -> None:
         """Clear all cached values."""
         self.cache.clear()
+        self._expiry.clear()
 
 
 # Global health check cache
@@ -399,7 +600,7 @@ def format_health_response(
         "version": version,
         "uptime_seconds": round(uptime_seconds, 2),
         "uptime": get_uptime_formatted(),
-        "timestamp": datetime.now().isoformat() + "Z",
+        "timestamp": format_utc_timestamp(),
         "service": "whatsapp-chatops-agent",
         "environment": os.getenv("ENVIRONMENT", "dev")
     }
@@ -5,13 +5,56 @@ This module provides comprehensive logging setup for the WhatsApp ChatOps Agent,
 including correlation ID propagation, structured output formatting, and context management.
 """
 
+import atexit
+import itertools
+import json
 import logging
+import queue
 import sys
 import os
-from typing import Any, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Optional
 import structlog
 from contextvars import ContextVar
 
+# Try to import orjson for faster log rendering (optional dependency)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Background listener that drains queued log records to stdout
+_queue_listener: Optional[QueueListener] = None
+
+# Logger for the bundled Union Action API (see configure_union_action_logging)
+_union_action_logger: Optional[structlog.stdlib.BoundLogger] = None
+
+# Deployment environment, read once by configure_logging rather than per record
+_environment = os.getenv("ENVIRONMENT", "dev")
+
+# Fields that might contain phone numbers (T065)
+_PHONE_FIELDS = frozenset({"from", "from_user", "workflow_id", "phone_number", "phone"})
+
+# Preview fields truncated when long (T065)
+_PREVIEW_FIELDS = frozenset({"narrative_preview", "maxim_preview", "raw_message"})
+
+
+def _sampling_interval(sample_rate: float) -> int:
+    """Convert a sampling rate into "keep one record in every N" (0 keeps none)."""
+    if sample_rate <= 0:
+        return 0
+    return max(1, int(1 / sample_rate))
+
+
+# T064: Keep every Nth info/debug record in production (LOG_SAMPLE_RATE=0.1 -> 1 in 10);
+# set from the environment by configure_logging
+_SAMPLE_INTERVAL = _sampling_interval(0.1)
+# One counter per event name, so each event type is sampled at the same
+# rate instead of a fixed per-request logging pattern aliasing with N
+_sample_counters: DefaultDict[Any, "itertools.count[int]"] = defaultdict(itertools.count)
 
 # Context variable for correlation ID propagation
 correlation_id_var: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
@@ -67,16 +110,17 @@ def redact_sensitive_data(logger: Any, method_name: str, event_dict: Dict[str, A
     Returns:
         Updated event dictionary with sensitive data redacted
     """
-    # Fields that might contain phone numbers
-    phone_fields = ["from", "from_user", "workflow_id", "phone_number", "phone"]
-    
-    for field in phone_fields:
-        if field in event_dict:
-            value = str(event_dict[field])
-            # If it looks like a phone number (digits only, 7+ chars)
-            if value.isdigit() and len(value) >= 7:
-                # Show only last 4 digits
-                event_dict[field] = "***" + value[-4:]
+    # Check each phone field against the event (the field set is small)
+    for field in _PHONE_FIELDS:
+        if field not in event_dict:
+            continue
+        value = event_dict[field]
+        if not isinstance(value, str):
+            value = str(value)
+        # If it looks like a phone number (digits only, 7+ chars)
+        if len(value) >= 7 and value.isdigit():
+            # Show only last 4 digits
+            event_dict[field] = "***" + value[-4:]
     
     # Redact long message bodies (keep preview only)
     if "message" in event_dict and isinstance(event_dict.get("message"), str):
@@ -85,11 +129,14 @@ def redact_sensitive_data(logger: Any, method_name: str, event_dict: Dict[str, A
             event_dict["message"] = msg[:200] + "...[redacted]"
     
     # Redact from narrative_preview and maxim_preview if they're long
-    for preview_field in ["narrative_preview", "maxim_preview", "raw_message"]:
-        if preview_field in event_dict:
-            preview = str(event_dict[preview_field])
-            if len(preview) > 100:
-                event_dict[preview_field] = preview[:100] + "...[redacted]"
+    for preview_field in _PREVIEW_FIELDS:
+        if preview_field not in event_dict:
+            continue
+        preview = event_dict[preview_field]
+        if not isinstance(preview, str):
+            preview = str(preview)
+        if len(preview) > 100:
+            event_dict[preview_field] = preview[:100] + "...[redacted]"
     
     return event_dict
 
@@ -103,12 +150,8 @@ def add_log_sampling(logger: Any, method_name: str, event_dict: Dict[str, Any])
     
     Returns None to drop the log entry, or event_dict to keep it.
     """
-    import random
-    
-    environment = os.getenv("ENVIRONMENT", "dev")
-    
     # In development, log everything
-    if environment == "dev":
+    if _environment == "dev":
         return event_dict
     
     # In production, always log errors and warnings
@@ -116,10 +159,9 @@ def add_log_sampling(logger: Any, method_name: str, event_dict: Dict[str, Any])
     if log_level in ["error", "warning", "critical"]:
         return event_dict
     
-    # Sample info and debug logs (10% sampling rate)
+    # Sample info and debug logs (10% sampling rate by default)
     if log_level in ["info", "debug"]:
-        sample_rate = float(os.getenv("LOG_SAMPLE_RATE", "0.1"))
-        if random.random() > sample_rate:
+        if not _SAMPLE_INTERVAL or next(_sample_counters[event_dict.get("event")]) % _SAMPLE_INTERVAL:
             # Drop this log entry
             raise structlog.DropEvent
     
@@ -144,10 +186,58 @@ def add_service_context(logger: Any, method_name: str, event_dict: Dict[str, Any
         Updated event dictionary with service context
     """
     event_dict["service_name"] = "whatsapp-chatops-agent"
-    event_dict["environment"] = os.getenv("ENVIRONMENT", "dev")
+    event_dict["environment"] = _environment
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer backed by orjson."""
+    try:
+        return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson.JSONEncodeError, e.g. integers beyond 64 bits - let the stdlib encoder handle it
+        return json.dumps(obj, **kwargs)
+
+
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """Build the JSON log renderer, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    return structlog.processors.JSONRenderer()
+
+
+def configure_queue_logging(level: int = logging.INFO) -> None:
+    """
+    Route standard library log output through a queue.
+    
+    Request threads only enqueue the already-rendered record; a
+    QueueListener thread performs the stdout writes. Safe to call more
+    than once - the listener is only started the first time.
+    
+    Args:
+        level: Root logger level
+    """
+    global _queue_listener
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    
+    if _queue_listener is not None:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    _queue_listener = QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+    # Drain remaining records on interpreter exit
+    atexit.register(_queue_listener.stop)
+    
+    root_logger.addHandler(QueueHandler(log_queue))
+
+
 def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     """
     Configure structured logging for the application and bundled Union Action API.
@@ -156,19 +246,21 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_logs: Whether to output logs in JSON format (True) or human-readable (False)
     """
+    global _environment, _SAMPLE_INTERVAL
+    
     # Set log level from environment or parameter
     level = os.getenv("LOG_LEVEL", log_level).upper()
+    _environment = os.getenv("ENVIRONMENT", "dev")
+    _SAMPLE_INTERVAL = _sampling_interval(float(os.getenv("LOG_SAMPLE_RATE", "0.1")))
     
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level, logging.INFO),
-    )
+    numeric_level = getattr(logging, level, logging.INFO)
+    
+    # Configure standard library logging (writes happen off the request path)
+    configure_queue_logging(numeric_level)
     
-    # Determine processors based on environment
+    # Determine processors based on environment. Level filtering happens in
+    # the bound logger (see wrapper_class), before any processor runs.
     processors = [
-        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -184,11 +276,9 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     
     # T085: Environment-specific logging configuration
     # Add renderer based on output format
-    environment = os.getenv("ENVIRONMENT", "dev")
-    
-    if json_logs or environment in ["production", "staging"]:
+    if json_logs or _environment in ["production", "staging"]:
         # JSON output for production/log aggregation (Render logs)
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(_json_renderer())
     else:
         # Human-readable output for development
         processors.append(structlog.dev.ConsoleRenderer())
@@ -196,6 +286,8 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     # Configure structlog
     structlog.configure(
         processors=processors,
+        # Methods below the configured level are no-ops
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -210,11 +302,17 @@ def configure_union_action_logging() -> None:
     Configure logging for the bundled Union Action API service.
     
     Sets up separate logging configuration for Union Action API
-    to ensure proper log separation and correlation.
+    to ensure proper log separation and correlation. The pipeline is bound
+    to a dedicated logger (see get_union_action_logger) rather than
+    installed globally, so the main application pipeline - including
+    redaction and sampling - stays in effect.
     """
+    global _union_action_logger
+    
     # Set Union Action API specific environment variables
     union_action_log_level = os.getenv("UNION_ACTION_LOG_LEVEL", os.getenv("LOG_LEVEL", "INFO"))
     union_action_log_format = os.getenv("UNION_ACTION_LOG_FORMAT", "json")
+    environment = os.getenv("ENVIRONMENT", "dev")
     
     # Configure Union Action API logging
     union_action_processors = [
@@ -235,16 +333,24 @@ def configure_union_action_logging() -> None:
         """Add Union Action API specific context to log entries."""
         event_dict["service_name"] = "union-action-api"
         event_dict["service_type"] = "bundled"
-        event_dict["environment"] = os.getenv("ENVIRONMENT", "dev")
+        event_dict["environment"] = environment
         return event_dict
     
     union_action_processors.append(add_union_action_context)
     
-    # Configure Union Action API structlog
-    structlog.configure(
+    if union_action_log_format == "json":
+        union_action_processors.append(_json_renderer())
+    else:
+        union_action_processors.append(structlog.dev.ConsoleRenderer())
+    
+    # Bind the Union Action API pipeline to its own stdlib logger
+    stdlib_logger = logging.getLogger("union-action-api")
+    stdlib_logger.setLevel(getattr(logging, union_action_log_level.upper(), logging.INFO))
+    _union_action_logger = structlog.wrap_logger(
+        stdlib_logger,
         processors=union_action_processors,
         wrapper_class=structlog.stdlib.BoundLogger,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        context_class=dict,
         cache_logger_on_first_use=True,
     )
 
@@ -262,6 +368,18 @@ def get_logger(name: str = __name__) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def get_union_action_logger() -> structlog.stdlib.BoundLogger:
+    """
+    Get the logger for the bundled Union Action API service.
+    
+    Returns:
+        Structlog logger using the Union Action API pipeline
+    """
+    if _union_action_logger is None:
+        configure_union_action_logging()
+    return _union_action_logger
+
+
 # Sample rate for logging (1.0 = log everything, 0.1 = log 10%)
 def should_sample_log(sample_rate: Optional[float] = None) -> bool:
     """
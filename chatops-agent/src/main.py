@@ -1,15 +1,23 @@
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 import structlog
 import os
 import time
-import uuid
+from time import perf_counter_ns
+from os import urandom
 import threading
 import asyncio
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Try to import orjson for faster JSON parsing/rendering (optional dependency)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .union_action_client_http import UnionActionClient
 from .logging_config import configure_logging, set_correlation_id, clear_correlation_id, get_correlation_id
 from .services.platform_service import PlatformService
@@ -29,7 +37,9 @@ from .error_responses import (
     build_integration_error_response,
     build_server_error_response,
     build_success_response,
-    log_error_with_context
+    log_error_with_context,
+    set_request_timestamp,
+    clear_request_timestamp
 )
 from .diagnostics import error_tracker, log_slow_operation
 from .validation import (
@@ -39,13 +49,13 @@ from .validation import (
     get_validation_summary
 )
 from .health_checks import (
-    check_memory_usage,
-    check_union_action_api,
+    run_all_checks,
     get_uptime,
-    check_recent_errors,
     aggregate_health_status,
     format_health_response,
-    health_cache
+    health_cache,
+    init_health_check_semaphore,
+    close_health_check_client
 )
 from .metrics import (
     metrics_collector,
@@ -55,23 +65,33 @@ from .metrics import (
 
 load_dotenv()
 
+# Environment settings, read once after .env has been loaded
+_ENV = os.getenv("ENVIRONMENT", "dev")
+_IS_DEV = _ENV == "dev"
+_UNION_URL = os.getenv("UNION_ACTION_API_URL", "http://localhost:8000")
+_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
 # Configure logging with enhanced diagnostic features
 configure_logging(
-    log_level=os.getenv("LOG_LEVEL", "INFO"),
-    json_logs=os.getenv("ENVIRONMENT", "dev") != "dev"
+    log_level=_LOG_LEVEL,
+    json_logs=not _IS_DEV
 )
 
+# JSON response class: orjson-backed when available
+_JSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 app = FastAPI(
     title="WhatsApp ChatOps Agent",
     description="An agent to orchestrate the Union Action Workflow Integration API via WhatsApp with comprehensive diagnostics.",
     version="0.1.0",
+    default_response_class=_JSONResponse,
 )
 
 logger = structlog.get_logger(__name__)
 
 # Initialize the Union Action Client (HTTP API integration)
 union_action_client = UnionActionClient(
-    base_url=os.getenv("UNION_ACTION_API_URL", "http://localhost:8000"),
+    base_url=_UNION_URL,
     timeout=float(os.getenv("UNION_ACTION_TIMEOUT", "30.0"))
 )
 
@@ -99,8 +119,11 @@ async def startup_health_check():
     """
     logger.info("startup_health_check_starting")
 
+    # Size health check concurrency now that .env has been loaded
+    init_health_check_semaphore()
+
     # Start bundled Union Action API if running in bundled mode
-    union_action_url = os.getenv("UNION_ACTION_API_URL", "http://localhost:8000")
+    union_action_url = _UNION_URL
     if union_action_url.startswith("http://localhost") or union_action_url.startswith("http://127.0.0.1"):
         logger.info("starting_bundled_union_action_api")
         try:
@@ -171,6 +194,11 @@ async def graceful_shutdown():
     except Exception as e:
         logger.error("union_action_client_close_error", error=str(e))
 
+    try:
+        await close_health_check_client()
+    except Exception as e:
+        logger.error("health_check_client_close_error", error=str(e))
+
     # Log final metrics before shutdown
     from .metrics import metrics_collector, format_json_metrics
     final_metrics = format_json_metrics(metrics_collector)
@@ -184,81 +212,114 @@ async def graceful_shutdown():
     logger.info("graceful_shutdown_complete")
 
 
-# Correlation ID Middleware (T010)
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to add correlation IDs to all requests for tracing."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Generate or extract correlation ID
-        correlation_id = request.headers.get(
-            "X-Correlation-ID",
-            str(uuid.uuid4())
-        )
-
-        # Set correlation ID in context
-        set_correlation_id(correlation_id)
-
-        try:
-            response = await call_next(request)
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
-            return response
-        finally:
-            # Clear correlation ID after request
-            clear_correlation_id()
+# Correlation ID response header name, pre-encoded for ASGI header lists
+_H_CORR = b"x-correlation-id"
 
 
-# Request/Response Logging Middleware (T015)
-class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests and responses with timing."""
+# Correlation ID (T010) and Request/Response Logging (T015) Middleware
+class ObservabilityMiddleware:
+    """
+    Middleware that assigns correlation IDs and logs requests with timing.
 
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+    Implemented as a single plain ASGI middleware: one wrapper per request,
+    no Request/Response objects and no extra task (unlike BaseHTTPMiddleware).
+    """
 
-        # Log incoming request
-        logger.info(
-            "request_received",
-            method=request.method,
-            path=request.url.path,
-            client_host=request.client.host if request.client else None,
-            correlation_id=get_correlation_id()
-        )
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = perf_counter_ns()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+
+        # Generate or extract correlation ID (the raw header bytes are
+        # echoed back as-is, so no re-encoding is needed)
+        correlation_id_bytes = None
+        for name, value in scope["headers"]:
+            if name == _H_CORR:
+                correlation_id_bytes = value
+                correlation_id = value.decode("latin-1")
+                break
+        if correlation_id_bytes is None:
+            # 128 random bits as 32 hex chars (same shape as uuid4().hex)
+            correlation_id = urandom(16).hex()
+            correlation_id_bytes = correlation_id.encode("ascii")
+
+        # Set correlation ID and shared response timestamp in context
+        set_correlation_id(correlation_id)
+        set_request_timestamp()
+
+        correlation_header = (_H_CORR, correlation_id_bytes)
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers
+                headers = [
+                    header for header in message.get("headers", [])
+                    if header[0].lower() != _H_CORR
+                ]
+                headers.append(correlation_header)
+                message["headers"] = headers
+            await send(message)
 
         try:
-            response = await call_next(request)
-            duration_ms = (time.time() - start_time) * 1000
+            # Log incoming request
+            logger.info(
+                "request_received",
+                method=method,
+                path=path,
+                client_host=client[0] if client else None,
+                correlation_id=correlation_id
+            )
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as e:
+                duration_ms = (perf_counter_ns() - start_ns) / 1e6
+                logger.error(
+                    "request_failed",
+                    method=method,
+                    path=path,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    duration_ms=round(duration_ms, 2),
+                    correlation_id=correlation_id
+                )
+                raise
+
+            duration_ms = (perf_counter_ns() - start_ns) / 1e6
 
             # Log response
             logger.info(
                 "request_completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
+                method=method,
+                path=path,
+                status_code=status_code,
                 duration_ms=round(duration_ms, 2),
-                correlation_id=get_correlation_id()
+                correlation_id=correlation_id
             )
 
             # Check for slow requests
-            log_slow_operation(f"{request.method} {request.url.path}", duration_ms)
-
-            return response
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(
-                "request_failed",
-                method=request.method,
-                path=request.url.path,
-                error=str(e),
-                error_type=type(e).__name__,
-                duration_ms=round(duration_ms, 2),
-                correlation_id=get_correlation_id()
-            )
-            raise
+            log_slow_operation(f"{method} {path}", duration_ms)
+        finally:
+            # Clear request-scoped context after request
+            clear_correlation_id()
+            clear_request_timestamp()
 
 
-# Add middleware to app
-app.add_middleware(CorrelationIDMiddleware)
-app.add_middleware(RequestResponseLoggingMiddleware)
+# Add middleware to app (last added is outermost: ObservabilityMiddleware
+# wraps GZip so request timing includes compression)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+app.add_middleware(ObservabilityMiddleware)
 
 
 # Global Exception Handler (T014)
@@ -309,7 +370,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         )
         status_code = 500
 
-    return JSONResponse(content=response, status_code=status_code)
+    return _JSONResponse(content=response, status_code=status_code)
 
 
 @app.post("/webhook")
@@ -328,7 +389,10 @@ async def handle_webhook(request: Request):
 
     try:
         # Parse and log incoming payload (T023)
-        data = await request.json()
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(await request.body())
+        else:
+            data = await request.json()
         logger.info(
             "webhook_received",
             from_user=data.get("from", "unknown"),
@@ -349,7 +413,7 @@ async def handle_webhook(request: Request):
             # Track validation error
             error_tracker.track_error("validation", {"reason": error_message})
 
-            return JSONResponse(
+            return _JSONResponse(
                 content=build_validation_error_response(
                     message=error_message,
                     field_name="body",
@@ -382,7 +446,7 @@ async def handle_webhook(request: Request):
             # Track parse error
             error_tracker.track_error("parsing", {"reason": error_message})
 
-            return JSONResponse(
+            return _JSONResponse(
                 content=build_parse_error_response(
                     message=error_message,
                     parse_stage="format_validation"
@@ -414,7 +478,7 @@ async def handle_webhook(request: Request):
             # Track validation error
             error_tracker.track_error("validation", {"reason": error_message, "field": "workflow_id"})
 
-            return JSONResponse(
+            return _JSONResponse(
                 content=build_validation_error_response(
                     message=error_message,
                     field_name="from",
@@ -539,7 +603,7 @@ async def handle_webhook(request: Request):
         log_slow_operation("webhook_processing", total_duration_ms)
 
         # Build success response with timing (T042)
-        return JSONResponse(
+        return _JSONResponse(
             content=build_success_response(result, total_duration_ms),
             status_code=200
         )
@@ -567,7 +631,7 @@ async def handle_webhook(request: Request):
         raise
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """
     Comprehensive health check endpoint (T052-T056).
 
@@ -576,7 +640,7 @@ def health_check():
     - Dependency health checks - Union Action API (T053)
     - System resource checks - memory usage (T054)
     - Recent error count (last 5 minutes) (T055)
-    - Cached results (10 second TTL) to prevent overload (T056)
+    - Cached results (27s when ok, 9s otherwise) to prevent overload (T056)
     """
     # Check cache first (T056)
     cached_result = health_cache.get("health_check")
@@ -586,14 +650,19 @@ def health_check():
 
     logger.debug("health_check_cache_miss_running_checks")
 
-    # T054: Check system resources (memory)
-    memory_check = check_memory_usage(threshold_percent=80.0)
+    # Concurrent misses share a single run of the checks
+    return await health_cache.get_or_compute("health_check", _compute_health_report)
+
 
-    # Check Union Action API health
-    union_action_check = check_union_action_api()
+async def _compute_health_report():
+    """Run the health checks and build the /health response (uncached)."""
 
-    # T055: Get recent error count (last 5 minutes)
-    recent_errors = check_recent_errors(time_window_seconds=300)
+    # Run the independent checks concurrently: Union Action API health,
+    # system resources (T054) and recent error count, last 5 minutes (T055)
+    checks = await run_all_checks(memory_threshold_percent=80.0, error_window_seconds=300)
+    memory_check = checks["memory"]
+    union_action_check = checks["union_action_api"]
+    recent_errors_count = checks["recent_errors"].get("count", 0)
 
     # Get error tracker summary for overall metrics
     error_summary = error_tracker.get_summary()
@@ -603,7 +672,7 @@ def health_check():
     overall_status = aggregate_health_status(checks_list)
 
     # If too many recent errors, degrade status
-    if recent_errors["count"] > 10:
+    if recent_errors_count > 10:
         overall_status = "degraded"
 
     # T052: Build response with version, uptime, timestamp
@@ -619,35 +688,42 @@ def health_check():
             "total_errors": error_summary["total_errors"],
             "errors_by_category": error_summary["errors"],
             "recent_errors_count": error_summary["recent_errors_count"],
-            "recent_errors_last_5min": recent_errors["count"],
+            "recent_errors_last_5min": recent_errors_count,
             "time_since_reset_seconds": error_summary["time_since_reset_seconds"]
         }
     )
 
-    # Cache result for 10 seconds (T056)
-    health_cache.set("health_check", response)
-
     logger.info(
         "health_check_complete",
         status=overall_status,
         union_action_api_status=union_action_check["status"],
         memory_status=memory_check["status"],
-        recent_errors_5min=recent_errors["count"]
+        recent_errors_5min=recent_errors_count
     )
 
     return response
 
 
+# Short TTLs for scrape-heavy diagnostic endpoints
+METRICS_CACHE_TTL_SECONDS = 2
+HEALTH_ERRORS_CACHE_TTL_SECONDS = 5
+
+
 @app.get("/health/errors")
-def health_errors():
+async def health_errors():
     """
     Detailed error information endpoint (T047).
 
-    Returns recent error details for debugging.
+    Returns recent error details for debugging (cached briefly). Async so
+    health_cache is only touched from the event loop.
     """
+    cached_result = health_cache.get("health:errors")
+    if cached_result is not None:
+        return cached_result
+
     error_summary = error_tracker.get_summary()
 
-    return {
+    response = {
         "status": "ok",
         "timestamp": datetime.now().isoformat(),
         "error_metrics": error_summary["errors"],
@@ -656,14 +732,18 @@ def health_errors():
         "time_since_reset": error_summary["time_since_reset_seconds"],
         "last_reset": error_summary["last_reset"]
     }
+    health_cache.set("health:errors", response, ttl=HEALTH_ERRORS_CACHE_TTL_SECONDS)
+    return response
 
 
 @app.get("/metrics")
-def metrics(format: str = "prometheus"):
+async def metrics(format: str = "prometheus"):
     """
     Prometheus-compatible metrics endpoint (T058).
 
-    Returns service metrics in Prometheus text format or JSON.
+    Returns service metrics in Prometheus text format or JSON. Rendered
+    output is cached briefly so frequent scrapes don't recompute it.
+    Async so health_cache is only touched from the event loop.
 
     Args:
         format: Response format ('prometheus' or 'json')
@@ -673,11 +753,18 @@ def metrics(format: str = "prometheus"):
     """
     if format.lower() == "json":
         # Return JSON format
-        return format_json_metrics(metrics_collector)
+        metrics_json = health_cache.get("metrics:json")
+        if metrics_json is None:
+            metrics_json = format_json_metrics(metrics_collector)
+            health_cache.set("metrics:json", metrics_json, ttl=METRICS_CACHE_TTL_SECONDS)
+        return metrics_json
     else:
         # Return Prometheus text format
         from fastapi.responses import PlainTextResponse
-        metrics_text = format_prometheus_metrics(metrics_collector)
+        metrics_text = health_cache.get("metrics:prom")
+        if metrics_text is None:
+            metrics_text = format_prometheus_metrics(metrics_collector)
+            health_cache.set("metrics:prom", metrics_text, ttl=METRICS_CACHE_TTL_SECONDS)
         return PlainTextResponse(content=metrics_text, media_type="text/plain")
 
 
@@ -719,7 +806,7 @@ def debug_endpoint():
         Debug information or 403 if not in dev mode
     """
     # Only allow in dev mode
-    if os.getenv("ENVIRONMENT", "dev") != "dev":
+    if not _IS_DEV:
         raise HTTPException(
             status_code=403,
             detail="Debug endpoint only available in development mode"
@@ -744,7 +831,7 @@ def debug_endpoint():
             "name": "whatsapp-chatops-agent",
             "version": "0.1.0",
             "uptime_seconds": get_uptime(),
-            "environment": os.getenv("ENVIRONMENT", "dev")
+            "environment": _ENV
         },
         "system": {
             "memory_mb": round(memory_info.rss / (1024 * 1024), 2),
@@ -762,9 +849,9 @@ def debug_endpoint():
             "response_times": metrics_data.get("response_times", {})
         },
         "configuration": {
-            "union_api_url": os.getenv("UNION_ACTION_API_URL", "not_set"),
-            "log_level": os.getenv("LOG_LEVEL", "INFO"),
-            "environment": os.getenv("ENVIRONMENT", "dev")
+            "union_api_url": _UNION_URL,
+            "log_level": _LOG_LEVEL,
+            "environment": _ENV
         }
     }
 
@@ -19,8 +19,22 @@ import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Connection pool sized for bursts of concurrent webhook requests
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0
+)
+
 
 class UnionActionClient:
     """
@@ -51,10 +65,13 @@ class UnionActionClient:
         self.base_url = base_url or os.getenv("UNION_ACTION_API_URL", "http://localhost:8000")
         self.timeout = timeout
 
-        # Initialize HTTP client
+        # Initialize HTTP client (shared for the client's lifetime so
+        # keep-alive connections are reused across requests)
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
+            limits=DEFAULT_POOL_LIMITS,
+            http2=HTTP2_AVAILABLE,
             headers={
                 "Content-Type": "application/json",
                 "User-Agent": "ChatOps-Agent/1.0"
@@ -66,7 +83,8 @@ class UnionActionClient:
             mode="http_api_integration",
             base_url=self.base_url,
             timeout=self.timeout,
-            http_client=True
+            http_client=True,
+            http2=HTTP2_AVAILABLE
         )
 
     async def __aenter__(self):
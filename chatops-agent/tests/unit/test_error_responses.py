@@ -0,0 +1,83 @@
+"""
+Unit tests for client-facing error responses.
+
+These tests verify that error details are only exposed in development.
+"""
+
+from dotenv import load_dotenv
+
+from src import error_responses
+from src.error_responses import (
+    clear_request_timestamp,
+    format_utc_timestamp,
+    get_response_timestamp,
+    refresh_env,
+    sanitize_error_for_client,
+    set_request_timestamp,
+)
+
+
+class TestSanitizeErrorForClient:
+    """Test sanitize_error_for_client environment handling."""
+    
+    def teardown_method(self):
+        """Drop the cached environment flag between tests."""
+        refresh_env()
+    
+    def test_environment_from_dotenv_hides_details(self, tmp_path, monkeypatch):
+        """Test that ENVIRONMENT set only in .env (loaded after import) is honoured."""
+        # State as at import time: no ENVIRONMENT in the process yet
+        monkeypatch.delenv("ENVIRONMENT", raising=False)
+        refresh_env()
+        env_file = tmp_path / ".env"
+        env_file.write_text("ENVIRONMENT=production\n")
+        
+        load_dotenv(env_file)
+        try:
+            message = sanitize_error_for_client(ValueError("secret detail"))
+        finally:
+            monkeypatch.delenv("ENVIRONMENT", raising=False)
+        
+        assert message == "An error occurred while processing your request"
+    
+    def test_dev_environment_includes_details(self, monkeypatch):
+        """Test that development mode includes the exception text."""
+        monkeypatch.setenv("ENVIRONMENT", "dev")
+        refresh_env()
+        
+        assert sanitize_error_for_client(ValueError("boom")) == "Error: boom"
+    
+    def test_include_details_overrides_environment(self, monkeypatch):
+        """Test that include_details exposes the exception text in production."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        refresh_env()
+        
+        assert sanitize_error_for_client(ValueError("boom"), include_details=True) == "Error: boom"
+
+
+class TestResponseTimestamp:
+    """Test the per-request response timestamp."""
+    
+    def teardown_method(self):
+        """Close the request timestamp slot between tests."""
+        clear_request_timestamp()
+    
+    def test_timestamp_taken_on_first_use_and_reused(self, monkeypatch):
+        """Test that a request's timestamp is read when first built and then shared."""
+        clock = iter([100.0, 200.0, 300.0])
+        monkeypatch.setattr(error_responses.time, "time", lambda: next(clock))
+        
+        set_request_timestamp()
+        first = get_response_timestamp()
+        second = get_response_timestamp()
+        
+        assert first == format_utc_timestamp(100.0)
+        assert second == first
+    
+    def test_outside_request_returns_fresh_timestamp(self, monkeypatch):
+        """Test that each call outside a request reads the clock."""
+        clock = iter([100.0, 200.0])
+        monkeypatch.setattr(error_responses.time, "time", lambda: next(clock))
+        
+        assert get_response_timestamp() == format_utc_timestamp(100.0)
+        assert get_response_timestamp() == format_utc_timestamp(200.0)
@@ -0,0 +1,83 @@
+"""
+Unit tests for the health check cache.
+
+These tests verify single-flight behaviour of HealthCheckCache.get_or_compute.
+"""
+
+import asyncio
+
+import pytest
+
+from src.health_checks import HealthCheckCache
+
+
+class TestHealthCheckCacheGetOrCompute:
+    """Test HealthCheckCache.get_or_compute."""
+    
+    def test_concurrent_callers_share_one_computation(self):
+        """Test that concurrent misses for the same key compute only once."""
+        cache = HealthCheckCache()
+        calls = []
+        
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"status": "ok"}
+        
+        async def run():
+            return await asyncio.gather(
+                *(cache.get_or_compute("health", compute) for _ in range(5))
+            )
+        
+        results = asyncio.run(run())
+        
+        assert results == [{"status": "ok"}] * 5
+        assert len(calls) == 1
+        assert cache.get("health") == {"status": "ok"}
+    
+    def test_cancelled_first_caller_does_not_cancel_waiters(self):
+        """Test that cancelling the caller that started the computation spares the others."""
+        cache = HealthCheckCache()
+        
+        async def run():
+            release = asyncio.Event()
+            
+            async def compute():
+                await release.wait()
+                return {"status": "ok"}
+            
+            first = asyncio.create_task(cache.get_or_compute("health", compute))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(cache.get_or_compute("health", compute))
+            await asyncio.sleep(0)
+            
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+        
+        assert asyncio.run(run()) == {"status": "ok"}
+        assert cache.get("health") == {"status": "ok"}
+    
+    def test_exception_propagates_to_all_callers(self):
+        """Test that a failed computation raises for every waiting caller and is not cached."""
+        cache = HealthCheckCache()
+        
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("check failed")
+        
+        async def run():
+            return await asyncio.gather(
+                cache.get_or_compute("health", compute),
+                cache.get_or_compute("health", compute),
+                return_exceptions=True
+            )
+        
+        results = asyncio.run(run())
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.get("health") is None
@@ -0,0 +1,55 @@
+"""
+Unit tests for logging configuration processors.
+
+These tests verify production log sampling behaviour.
+"""
+
+from collections import Counter, defaultdict
+import itertools
+
+import pytest
+import structlog
+
+from src import logging_config
+from src.logging_config import add_log_sampling
+
+
+class TestLogSampling:
+    """Test add_log_sampling."""
+    
+    @pytest.fixture(autouse=True)
+    def production_sampling(self, monkeypatch):
+        """Sample one in two info records, as in production."""
+        monkeypatch.setattr(logging_config, "_environment", "production")
+        monkeypatch.setattr(logging_config, "_SAMPLE_INTERVAL", 2)
+        monkeypatch.setattr(logging_config, "_sample_counters", defaultdict(itertools.count))
+    
+    def _kept_events(self, events):
+        """Run events through the sampler and count the ones kept per name."""
+        kept = Counter()
+        for event in events:
+            try:
+                add_log_sampling(None, "info", {"event": event, "level": "info"})
+            except structlog.DropEvent:
+                continue
+            kept[event] += 1
+        return kept
+    
+    def test_alternating_events_are_both_kept(self):
+        """Test that events logged in a fixed pattern are each sampled."""
+        kept = self._kept_events(["request_received", "request_completed"] * 50)
+        
+        assert kept["request_received"] == 25
+        assert kept["request_completed"] == 25
+    
+    def test_warnings_are_never_dropped(self):
+        """Test that warning records bypass sampling."""
+        for _ in range(10):
+            event_dict = {"event": "slow_operation", "level": "warning"}
+            assert add_log_sampling(None, "warning", event_dict) is event_dict
+    
+    def test_zero_rate_drops_info_records(self, monkeypatch):
+        """Test that a sample rate of 0 drops all info records."""
+        monkeypatch.setattr(logging_config, "_SAMPLE_INTERVAL", 0)
+        
+        assert self._kept_events(["request_received"] * 10) == Counter()